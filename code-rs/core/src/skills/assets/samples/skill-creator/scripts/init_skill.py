@@ -11,18 +11,42 @@ Examples:
     init_skill.py custom-skill --path /custom/location
 """
 
-import re
+import os
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 
-MAX_SKILL_NAME_LENGTH = 64
+from skill_utils import MAX_SKILL_NAME_LENGTH, SKILL_NAME_RE
 
-SKILL_TEMPLATE = """---
-name: {skill_name}
+# If creating SKILL.md takes longer than this, the filesystem is treated as
+# high-latency and the example files are written concurrently. Below it the
+# concurrent.futures import and thread startup cost more than they save.
+_SLOW_WRITE_SECONDS = 0.005
+
+USAGE = f"""Usage: init_skill.py <skill-name> --path <path>
+
+Skill name requirements:
+  - Use a hyphen-case identifier (e.g., 'data-analyzer')
+  - Input is normalized to lowercase letters, digits, and hyphens only (e.g., 'Plan Mode' -> 'plan-mode')
+  - Max {MAX_SKILL_NAME_LENGTH} characters after normalization
+  - Directory name matches the normalized skill name
+
+Examples:
+  init_skill.py my-new-skill --path skills/public
+  init_skill.py my-api-helper --path skills/private
+  init_skill.py custom-skill --path /custom/location
+"""
+
+# Templates are tokenized once at import; string.Template avoids re-parsing
+# the str.format fields of the large SKILL.md body on every substitution.
+SKILL_TEMPLATE = Template("""---
+name: ${skill_name}
 description: [TODO: Complete and informative explanation of what the skill does and when to use it. Include WHEN to use this skill - specific scenarios, file types, or tasks that trigger it.]
 ---
 
-# {skill_title}
+# ${skill_title}
 
 [TODO: 1-2 sentences explaining what this skill enables]
 
@@ -86,21 +110,21 @@ Templates, example data, or other static files.
 - `config.json` - Configuration templates
 
 **Any unneeded directories can be deleted.** Not every skill requires all three types of resources.
-"""
+""")
 
-EXAMPLE_SCRIPT = '''#!/usr/bin/env python3
+EXAMPLE_SCRIPT = Template('''#!/usr/bin/env python3
 """
-Example helper script for {skill_name}
+Example helper script for ${skill_name}
 """
 
 def main():
-    print("This is an example script for {skill_name}")
+    print("This is an example script for ${skill_name}")
 
 if __name__ == "__main__":
     main()
-'''
+''')
 
-EXAMPLE_REFERENCE = """# Reference Documentation for {skill_title}
+EXAMPLE_REFERENCE = Template("""# Reference Documentation for ${skill_title}
 
 This is an example reference document. Use this space for:
 
@@ -113,32 +137,103 @@ This is an example reference document. Use this space for:
 ## Example Section
 
 Add your reference content here.
-"""
+""")
 
 EXAMPLE_ASSET = """This is an example asset file.
 Replace with actual templates, data files, or other resources as needed.
 """
+_EXAMPLE_ASSET_BYTES = EXAMPLE_ASSET.encode("utf-8")
 
 
-def normalize_skill_name(skill_name):
-    """Normalize a skill name to lowercase hyphen-case."""
-    normalized = skill_name.strip().lower()
-    # Replace spaces and underscores with hyphens
-    normalized = re.sub(r"[ _]+", "-", normalized)
-    # Remove any characters that aren't alphanumeric or hyphen
-    normalized = re.sub(r"[^a-z0-9-]", "", normalized)
-    # Collapse multiple hyphens
-    normalized = re.sub(r"-+", "-", normalized)
-    # Remove leading/trailing hyphens
-    normalized = normalized.strip("-")
-    return normalized
+def _split_template(template):
+    """Pre-split a Template into (literal bytes, placeholder name) segments."""
+    segments = []
+    pos = 0
+    for match in template.pattern.finditer(template.template):
+        name = match.group("named") or match.group("braced")
+        if name is None:
+            raise ValueError(f"Unsupported template syntax: {match.group()!r}")
+        segments.append((template.template[pos : match.start()].encode("utf-8"), name))
+        pos = match.end()
+    segments.append((template.template[pos:].encode("utf-8"), None))
+    return segments
+
+
+# SKILL.md is streamed to disk segment by segment instead of building the
+# substituted document in memory first
+_SKILL_SEGMENTS = _split_template(SKILL_TEMPLATE)
 
 
+def normalize_skill_name(skill_name):
+    """Normalize a skill name to lowercase hyphen-case."""
+    # Names that are already hyphen-case come back unchanged
+    if SKILL_NAME_RE.match(skill_name):
+        return skill_name
+
+    # Single pass: map spaces/underscores to hyphens, drop anything that isn't
+    # a lowercase ASCII letter, digit, or hyphen, and collapse hyphen runs.
+    out = []
+    prev_dash = True  # Suppresses leading hyphens
+    for ch in skill_name.strip().lower():
+        if ch in " _-":
+            if not prev_dash:
+                out.append("-")
+                prev_dash = True
+        elif ch.isascii() and ch.isalnum():
+            out.append(ch)
+            prev_dash = False
+    normalized = "".join(out)
+    # At most one trailing hyphen can remain
+    return normalized[:-1] if normalized.endswith("-") else normalized
+
+
+@lru_cache(maxsize=256)
 def title_case_skill_name(skill_name):
     """Convert hyphenated skill name to Title Case for display."""
     return " ".join(word.capitalize() for word in skill_name.split("-"))
 
 
+def _render_segments(segments, values):
+    """Yield the byte chunks of a pre-split template with values filled in."""
+    for literal, name in segments:
+        yield literal
+        if name is not None:
+            yield values[name].encode("utf-8")
+
+
+def _create_file(path, chunks, mode=0o666):
+    """Create a new file from byte chunks with the given permissions in a single open call."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    with os.fdopen(fd, "wb") as f:
+        f.writelines(chunks)
+
+
+def _create_files_concurrently(root, files, log):
+    """Create independent files in parallel to overlap their round-trips.
+
+    Each file that was written is logged in order; the first failure is re-raised
+    once all writes have finished.
+    """
+    # Deferred: only high-latency filesystems pay for the import
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        futures = [
+            executor.submit(_create_file, os.path.join(root, rel_path), (data,), mode)
+            for rel_path, data, mode in files
+        ]
+
+    error = None
+    for (rel_path, _, _), future in zip(files, futures):
+        exc = future.exception()
+        if exc is None:
+            log.append(f"✅ Created {rel_path}")
+        elif error is None:
+            error = exc
+    if error is not None:
+        raise error
+
+
 def init_skill(skill_name, path):
     """
     Initialize a new skill directory with template SKILL.md.
@@ -150,89 +245,87 @@ def init_skill(skill_name, path):
     Returns:
         Path to created skill directory, or None if error
     """
-    # Determine skill directory path
-    skill_dir = Path(path).resolve() / skill_name
+    # Progress messages are collected and written to stdout in one go
+    log = []
+    try:
+        return _create_skill(skill_name, path, log)
+    finally:
+        sys.stdout.write("\n".join(log) + "\n")
+        sys.stdout.flush()
 
-    # Check if directory already exists
-    if skill_dir.exists():
-        print(f"❌ Error: Skill directory already exists: {skill_dir}")
-        return None
 
-    # Create skill directory
+def _create_skill(skill_name, path, log):
+    """Create the skill directory tree, appending progress messages to log."""
+    # Determine skill directory path; it is only resolved once creation succeeds.
+    # The Path is kept for the return value and everything below works on strings.
+    skill_dir = Path(path) / skill_name
+    skill_dir_str = str(skill_dir)
+
+    # Create skill directory; mkdir itself is the existence check
     try:
-        skill_dir.mkdir(parents=True, exist_ok=False)
-        print(f"✅ Created skill directory: {skill_dir}")
+        os.makedirs(skill_dir_str)
+        log.append(f"✅ Created skill directory: {skill_dir}")
+    except FileExistsError:
+        log.append(f"❌ Error: Skill directory already exists: {skill_dir}")
+        return None
     except Exception as e:
-        print(f"❌ Error creating directory: {e}")
+        log.append(f"❌ Error creating directory: {e}")
         return None
 
     # Create SKILL.md from template
     skill_title = title_case_skill_name(skill_name)
-    skill_content = SKILL_TEMPLATE.format(skill_name=skill_name, skill_title=skill_title)
+    values = {"skill_name": skill_name, "skill_title": skill_title}
 
-    skill_md_path = skill_dir / "SKILL.md"
+    skill_md_path = os.path.join(skill_dir_str, "SKILL.md")
     try:
-        skill_md_path.write_text(skill_content)
-        print("✅ Created SKILL.md")
+        start = time.perf_counter()
+        _create_file(skill_md_path, _render_segments(_SKILL_SEGMENTS, values))
+        slow_fs = time.perf_counter() - start > _SLOW_WRITE_SECONDS
+        log.append("✅ Created SKILL.md")
     except Exception as e:
-        print(f"❌ Error creating SKILL.md: {e}")
+        log.append(f"❌ Error creating SKILL.md: {e}")
         return None
 
     # Create resource directories with example files
     try:
-        # Create scripts/ directory with example script
-        scripts_dir = skill_dir / "scripts"
-        scripts_dir.mkdir(exist_ok=True)
-        example_script = scripts_dir / "example.py"
-        example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
-        example_script.chmod(0o755)
-        print("✅ Created scripts/example.py")
-
-        # Create references/ directory with example reference doc
-        references_dir = skill_dir / "references"
-        references_dir.mkdir(exist_ok=True)
-        example_reference = references_dir / "api_reference.md"
-        example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
-        print("✅ Created references/api_reference.md")
-
-        # Create assets/ directory with example asset placeholder
-        assets_dir = skill_dir / "assets"
-        assets_dir.mkdir(exist_ok=True)
-        example_asset = assets_dir / "example_asset.txt"
-        example_asset.write_text(EXAMPLE_ASSET)
-        print("✅ Created assets/example_asset.txt")
+        for resource_dir in ("scripts", "references", "assets"):
+            os.mkdir(os.path.join(skill_dir_str, resource_dir))
+
+        script_bytes = EXAMPLE_SCRIPT.substitute(skill_name=skill_name).encode("utf-8")
+        reference_bytes = EXAMPLE_REFERENCE.substitute(skill_title=skill_title).encode("utf-8")
+        example_files = [
+            ("scripts/example.py", script_bytes, 0o755),
+            ("references/api_reference.md", reference_bytes, 0o666),
+            ("assets/example_asset.txt", _EXAMPLE_ASSET_BYTES, 0o666),
+        ]
+        if slow_fs:
+            _create_files_concurrently(skill_dir_str, example_files, log)
+        else:
+            for rel_path, data, mode in example_files:
+                _create_file(os.path.join(skill_dir_str, rel_path), (data,), mode)
+                log.append(f"✅ Created {rel_path}")
     except Exception as e:
-        print(f"❌ Error creating resource directories: {e}")
+        log.append(f"❌ Error creating resource directories: {e}")
         return None
 
     # Print next steps
-    print(f"\n✅ Skill '{skill_name}' initialized successfully at {skill_dir}")
-    print("\nNext steps:")
-    print("1. Edit SKILL.md to complete the TODO items and update the description")
-    print("2. Customize or delete the example files in scripts/, references/, and assets/")
-    print("3. Run the validator when ready to check the skill structure")
+    skill_dir = skill_dir.resolve()
+    log.append(f"\n✅ Skill '{skill_name}' initialized successfully at {skill_dir}")
+    log.append("\nNext steps:")
+    log.append("1. Edit SKILL.md to complete the TODO items and update the description")
+    log.append("2. Customize or delete the example files in scripts/, references/, and assets/")
+    log.append("3. Run the validator when ready to check the skill structure")
 
     return skill_dir
 
 
 def main():
-    if len(sys.argv) < 4 or sys.argv[2] != "--path":
-        print("Usage: init_skill.py <skill-name> --path <path>")
-        print("\nSkill name requirements:")
-        print("  - Use a hyphen-case identifier (e.g., 'data-analyzer')")
-        print(
-            "  - Input is normalized to lowercase letters, digits, and hyphens only "
-            "(e.g., 'Plan Mode' -> 'plan-mode')"
-        )
-        print(f"  - Max {MAX_SKILL_NAME_LENGTH} characters after normalization")
-        print("  - Directory name matches the normalized skill name")
-        print("\nExamples:")
-        print("  init_skill.py my-new-skill --path skills/public")
-        print("  init_skill.py my-api-helper --path skills/private")
-        print("  init_skill.py custom-skill --path /custom/location")
+    argv = sys.argv
+    if len(argv) != 4 or argv[2] != "--path":
+        sys.stdout.write(USAGE)
         sys.exit(1)
+    _, raw_skill_name, _, path = argv
 
-    raw_skill_name = sys.argv[1]
     skill_name = normalize_skill_name(raw_skill_name)
     if not skill_name:
         print("❌ Error: Skill name must include at least one letter or digit.")
@@ -243,14 +336,12 @@ def main():
             f"Maximum is {MAX_SKILL_NAME_LENGTH} characters."
         )
         sys.exit(1)
+    header = []
     if skill_name != raw_skill_name:
-        print(f"Note: Normalized skill name from '{raw_skill_name}' to '{skill_name}'.")
-
-    path = sys.argv[3]
-
-    print(f"🚀 Initializing skill: {skill_name}")
-    print(f"   Location: {path}")
-    print()
+        header.append(f"Note: Normalized skill name from '{raw_skill_name}' to '{skill_name}'.")
+    header.append(f"🚀 Initializing skill: {skill_name}")
+    header.append(f"   Location: {path}")
+    sys.stdout.write("\n".join(header) + "\n\n")
 
     result = init_skill(skill_name, path)
 
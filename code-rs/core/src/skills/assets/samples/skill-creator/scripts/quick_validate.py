@@ -3,10 +3,38 @@
 Quick validation script for skills - minimal version
 """
 
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
+from skill_utils import validate_skill_name
+
+# A top-level name/description key with a one-line plain scalar that YAML
+# can only read as a string: it starts with a letter and has no ':' or '#'.
+# Lines containing tabs never take this path; they fall back to PyYAML's
+# SafeLoader, which rejects tabs in some positions (e.g. trailing a value).
+_FM_LINE_RE = re.compile(r"(name|description): +([A-Za-z][^:#]*?) *\r?\n?\Z")
+_YAML_KEYWORDS = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+
+
+def _parse_simple_frontmatter(lines):
+    """Parse frontmatter holding only one-line name/description scalars.
+
+    Returns None for anything else so the caller can fall back to PyYAML.
+    """
+    fields = {}
+    for line in lines:
+        if not line.strip(" \r\n"):
+            continue
+        match = _FM_LINE_RE.match(line)
+        if not match or match.group(1) in fields:
+            return None
+        value = match.group(2)
+        if value.lower() in _YAML_KEYWORDS or not value.isprintable():
+            return None
+        fields[match.group(1)] = value
+    return fields if len(fields) == 2 else None
 
 
 def validate_skill(skill_path):
@@ -15,21 +43,44 @@ def validate_skill(skill_path):
 
     # Check SKILL.md exists
     skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
+    try:
+        stat = skill_md.stat()
+    except (FileNotFoundError, NotADirectoryError):
         return False, f"SKILL.md not found in {skill_path}"
 
-    # Read and parse frontmatter
-    content = skill_md.read_text()
-    if not content.startswith("---"):
-        return False, "SKILL.md must start with YAML frontmatter (---)"
-
-    try:
-        parts = content.split("---", 2)
-        if len(parts) < 3:
+    # Editing SKILL.md changes its mtime or size, which invalidates the cache entry
+    return _validate_skill_md(str(skill_md), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _validate_skill_md(skill_md, mtime_ns, size):
+    """Validate a SKILL.md file; cached per (path, mtime, size)."""
+    # Read only the frontmatter; the body is never loaded
+    with open(skill_md, "r", encoding="utf-8") as handle:
+        if handle.readline().strip() != "---":
+            return False, "SKILL.md must start with YAML frontmatter (---)"
+
+        # Stand-in for the opening delimiter so YAML error line numbers match the file
+        lines = ["\n"]
+        for line in handle:
+            if line.strip() == "---":
+                break
+            lines.append(line)
+        else:
             return False, "SKILL.md frontmatter must be closed with ---"
-        frontmatter = yaml.safe_load(parts[1])
-    except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+
+    frontmatter = _parse_simple_frontmatter(lines)
+    if frontmatter is None:
+        # Deferred so the common case never pays for importing PyYAML
+        import yaml
+
+        # Always the pure-Python loader: libyaml's CSafeLoader accepts input (such
+        # as trailing tabs) that SafeLoader rejects, which would make the verdict
+        # depend on how PyYAML was built.
+        try:
+            frontmatter = yaml.safe_load("".join(lines))
+        except yaml.YAMLError as e:
+            return False, f"Invalid YAML in frontmatter: {e}"
 
     # Validate required fields
     if not frontmatter or "name" not in frontmatter:
@@ -40,15 +91,9 @@ def validate_skill(skill_path):
     name = frontmatter.get("name", "")
     if not isinstance(name, str) or not name.strip():
         return False, "Name must be a non-empty string"
-    if not all(c.islower() or c.isdigit() or c == "-" for c in name):
-        return False, "Name must be lowercase with only letters, digits, and hyphens"
-    if name.startswith("-") or name.endswith("-") or "--" in name:
-        return (
-            False,
-            f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens",
-        )
-    if len(name) > 64:
-        return False, f"Name is too long ({len(name)} characters). Maximum is 64 characters."
+    valid, message = validate_skill_name(name)
+    if not valid:
+        return False, message
 
     description = frontmatter.get("description", "")
     if not isinstance(description, str):
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Shared helpers for skill-creator scripts."""
+
+import re
+
+MAX_SKILL_NAME_LENGTH = 64
+
+# Lowercase alphanumeric words joined by single hyphens
+SKILL_NAME_RE = re.compile(r"\A[a-z0-9]+(?:-[a-z0-9]+)*\Z")
+
+
+def validate_skill_name(name):
+    """Check a skill name's length and shape, returning (ok, message)."""
+    if len(name) > MAX_SKILL_NAME_LENGTH:
+        return (
+            False,
+            f"Name is too long ({len(name)} characters). "
+            f"Maximum is {MAX_SKILL_NAME_LENGTH} characters.",
+        )
+    if not SKILL_NAME_RE.match(name):
+        return (
+            False,
+            f"Name '{name}' must be lowercase letters, digits, and hyphens only, "
+            "and cannot start/end with hyphen or contain consecutive hyphens",
+        )
+    return True, ""
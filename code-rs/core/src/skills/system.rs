@@ -56,6 +56,10 @@ const EMBEDDED_SYSTEM_SKILLS: &[(&str, &[u8])] = &[
         "skill-creator/scripts/quick_validate.py",
         include_bytes!("assets/samples/skill-creator/scripts/quick_validate.py"),
     ),
+    (
+        "skill-creator/scripts/skill_utils.py",
+        include_bytes!("assets/samples/skill-creator/scripts/skill_utils.py"),
+    ),
     (
         "skill-installer/SKILL.md",
         include_bytes!("assets/samples/skill-installer/SKILL.md"),